@@ -5,63 +5,305 @@ combat power (CP) in Pokemon Go, and its type.
 
 To run::
     python choose_pokemon.py
+
+Pass ``--no-image`` or set the ``POKEMON_NO_IMAGE`` environment variable to skip
+opening the pokemon image.
+Set ``POKEMON_NUMBA`` to compile the Pokemon Go stat arithmetic with numba.
 """
-import json
 import os
+import pickle
 import random
+import sys
+import tempfile
 from collections import defaultdict
+from functools import lru_cache
 from math import floor, sqrt
-from typing import Dict, List, Sequence, Tuple
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
-from PIL import Image
+try:
+    import orjson as _json
+except ImportError:  # the stdlib parser also accepts bytes
+    import json as _json
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def load_pokemon_file() -> dict:
-    """Load pokemon stats from the ``pokedex.json`` file in the same folder.
+
+class PogoStats(NamedTuple):
+    """Base stats and maximum CP of a pokemon in Pokemon Go."""
+
+    ATK: int
+    DEF: int
+    STA: int
+    CP: int
+
+
+EFFECTIVENESS_DELTAS = (
+    ("super effective", 1),
+    ("not very effective", -1),
+    ("no effect", -2),
+)
+
+
+def _is_up_to_date(cache_path: str, source_path: str) -> bool:
+    """Check that ``cache_path`` exists and is not older than ``source_path``."""
+    if not os.path.exists(cache_path):
+        return False
+    return os.path.getmtime(cache_path) >= os.path.getmtime(source_path)
+
+
+def _write_pickle(obj, path: str) -> None:
+    """Atomically pickle ``obj`` to ``path``, ignoring write failures.
+
+    The data is written to a temporary file in the same folder and renamed
+    into place, so readers never see a partially written file. The file gets the
+    same umask-based permissions as one created with ``open(path, "wb")``.
+    """
+    folder, name = os.path.split(path)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f".{name}.")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # mkstemp always creates the file as 0600
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _read_pokedex(fpath: str) -> dict:
+    """Load the pokemon dict from ``fpath``, using its ``.pkl`` sidecar cache.
+
+    Args:
+        fpath (str): Path of the ``pokedex.json`` file.
 
     Returns:
         dict: Pokemon information, keyed by pokemon index (int)
     """
-    fpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pokedex.json")
-    with open(fpath) as f:
-        pokemon_json = json.load(f)
-
-    pokemon_dict = {}
-    for pokemon in pokemon_json:
-        pokemon_dict[pokemon["id"]] = {
+    pkl_path = os.path.splitext(fpath)[0] + ".pkl"
+    if _is_up_to_date(pkl_path, fpath):
+        try:
+            with open(pkl_path, "rb") as f:
+                pokemon_dict = pickle.load(f)
+        except Exception:  # unreadable or corrupt; rebuilt from the json below
+            pokemon_dict = None
+        if isinstance(pokemon_dict, dict):
+            return pokemon_dict
+
+    with open(fpath, "rb") as f:
+        pokemon_json = _json.loads(f.read())
+
+    pokemon_dict = {
+        pokemon["id"]: {
             "name": pokemon["name"]["english"],
             "type": pokemon["type"],
             "base": pokemon["base"],
         }
+        for pokemon in pokemon_json
+    }
+
+    _write_pickle(pokemon_dict, pkl_path)
 
     return pokemon_dict
 
 
+@lru_cache(maxsize=1)
+def load_pokemon_file() -> dict:
+    """Load pokemon stats from the ``pokedex.json`` file in the same folder.
+
+    The parsed dict is cached in a ``pokedex.pkl`` sidecar next to the json file,
+    which is reused as long as it is newer than ``pokedex.json``. The result is
+    also memoized for the lifetime of the process; call
+    ``load_pokemon_file.cache_clear()`` to force a reload.
+
+    Returns:
+        dict: Pokemon information, keyed by pokemon index (int)
+    """
+    return _read_pokedex(_pokedex_json_path())
+
+
+def _default_pokedex_folder() -> str:
+    """Path of the split ``pokedex`` folder next to this file."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "pokedex")
+
+
+def _pokedex_json_path() -> str:
+    """Path of the ``pokedex.json`` file next to this file."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "pokedex.json")
+
+
+def load_split_pokemon_ids(pokedex_folder: Optional[str] = None) -> Optional[List[int]]:
+    """Load the pokemon indices written by ``split_pokedex.py``.
+
+    Args:
+        pokedex_folder (Optional[str], optional): Folder with the split pokedex
+            files. Defaults to the ``pokedex`` folder next to this file.
+
+    Returns:
+        Optional[List[int]]: Indices of the split pokemon files, or ``None`` if the
+            folder has not been built or is older than ``pokedex.json``.
+    """
+    if pokedex_folder is None:
+        pokedex_folder = _default_pokedex_folder()
+    fpath = os.path.join(pokedex_folder, "ids.json")
+    if not _is_up_to_date(fpath, _pokedex_json_path()):
+        return None
+
+    with open(fpath, "rb") as f:
+        return _json.loads(f.read())
+
+
+def load_pokemon_by_id(pokemon_idx: int, pokedex_folder: Optional[str] = None) -> dict:
+    """Load a single pokemon from the ``pokedex`` folder in the same folder.
+
+    The folder holds one ``<index>.json`` file per pokemon and is written by
+    ``split_pokedex.py``, so only the requested entry has to be parsed. If the
+    file is missing or older than ``pokedex.json``, the pokemon is looked up in
+    :py:func:`choose_pokemon.load_pokemon_file` instead.
+
+    Args:
+        pokemon_idx (int): Index of the pokemon.
+        pokedex_folder (Optional[str], optional): Folder with the split pokedex
+            files. Defaults to the ``pokedex`` folder next to this file.
+
+    Returns:
+        dict: Pokemon information, in the same format as the values returned by
+            :py:func:`choose_pokemon.load_pokemon_file`.
+    """
+    if pokedex_folder is None:
+        pokedex_folder = _default_pokedex_folder()
+    fpath = os.path.join(pokedex_folder, f"{pokemon_idx:03d}.json")
+    if not _is_up_to_date(fpath, _pokedex_json_path()):
+        return load_pokemon_file()[pokemon_idx]
+
+    with open(fpath, "rb") as f:
+        pokemon = _json.loads(f.read())
+
+    return {
+        "name": pokemon["name"]["english"],
+        "type": pokemon["type"],
+        "base": pokemon["base"],
+    }
+
+
+@lru_cache(maxsize=1)
 def load_pokemon_effectiveness() -> dict:
     """Load pokemon type effectiveness from the ``effectiveness.json`` file in
     the same folder.
 
+    The result is memoized for the lifetime of the process; call
+    ``load_pokemon_effectiveness.cache_clear()`` to force a reload.
+
     Returns:
         dict: Pokemon type effectiveness
     """
     fpath = os.path.join(
         os.path.dirname(os.path.abspath(__file__)), "effectiveness.json"
     )
-    with open(fpath) as f:
-        type_effectiveness = json.load(f)
+    with open(fpath, "rb") as f:
+        type_effectiveness = _json.loads(f.read())
 
     return type_effectiveness
 
 
+def _make_pogo_stats_core(_floor=floor, _sqrt=sqrt, _round=round):
+    """Build the Pokemon Go stat arithmetic used by ``calculate_pogo_stats``.
+
+    ``floor``, ``sqrt`` and ``round`` are bound as arguments of this factory, so
+    the returned function reads them from its closure instead of looking them up
+    as globals on every call. numba compiles the same function, since it resolves
+    closure variables at compile time.
+    """
+
+    def _pogo_stats_core(
+        hp,
+        attack,
+        sp_attack,
+        defense,
+        sp_defense,
+        speed,
+        max_iv,
+        cp_scale,
+        cp_ceiling,
+        cp_nerf,
+    ):
+        max_attack = attack if attack > sp_attack else sp_attack
+        min_attack = sp_attack if attack > sp_attack else attack
+        max_defense = defense if defense > sp_defense else sp_defense
+        min_defense = sp_defense if defense > sp_defense else defense
+
+        # round(2 * (7 * a / 8 + b / 8)) == round((7 * a + b) / 4); the quarter
+        # is rounded half to even in integers, exactly like round() does.
+        attack_sum = 7 * max_attack + min_attack
+        defense_sum = 5 * max_defense + 3 * min_defense
+        attack_mix = (attack_sum + 1 + ((attack_sum >> 2) & 1)) >> 2
+        defense_mix = (defense_sum + 1 + ((defense_sum >> 2) & 1)) >> 2
+
+        pogo_speed = 1 + ((speed - 75) / 500)
+        pogo_attack = _round(attack_mix * pogo_speed) + max_iv
+        pogo_defense = _round(defense_mix * pogo_speed) + max_iv
+        # floor(hp * 1.75 + 50) == (hp * 7 + 200) // 4 for integer hp
+        pogo_hp = ((hp * 7 + 200) >> 2) + max_iv
+        pogo_cp = pogo_attack * _sqrt(pogo_defense * pogo_hp) * cp_scale
+        pogo_cp = _floor(pogo_cp if pogo_cp > 10 else 10)
+
+        # Apply the nerf without branching: the correction is zeroed below the
+        # ceiling
+        pogo_cp -= (pogo_cp - _round(pogo_cp * cp_nerf)) * (pogo_cp >= cp_ceiling)
+
+        return pogo_attack - max_iv, pogo_defense - max_iv, pogo_hp - max_iv, pogo_cp
+
+    return _pogo_stats_core
+
+
+_pogo_stats_core = _make_pogo_stats_core()
+
+
+def _jit_pogo_stats_core():
+    """Compile ``_pogo_stats_core`` with numba.
+
+    Returns:
+        The numba dispatcher for ``_pogo_stats_core``.
+    """
+    from numba import njit
+
+    core = getattr(_pogo_stats_core, "py_func", _pogo_stats_core)
+    # Full fastmath lets LLVM reassociate the rounded sums, which changes results.
+    return njit(cache=True, fastmath={"nnan", "ninf", "nsz"})(core)
+
+
+# numba takes a few hundred ms to import, so only pay for it when asked to.
+if os.environ.get("POKEMON_NUMBA"):
+    _pogo_stats_core = _jit_pogo_stats_core()
+
+
 def calculate_pogo_stats(
     pokemon_base: Dict[str, int],
     max_iv: int = 15,
     cp_modifier: float = 0.7903001,
     cp_ceiling: int = 4000,
     cp_nerf: float = 0.91,
-) -> Sequence[int]:
+    *,
+    _core=_pogo_stats_core,
+    _stats=PogoStats,
+) -> PogoStats:
     """Calculate pokemon go stats in Pokemon Go.
 
+    The arithmetic is done in ``_pogo_stats_core``, which is compiled with numba
+    when the ``POKEMON_NUMBA`` environment variable is set. The keyword-only
+    ``_core`` and ``_stats`` arguments bind the globals used here as locals and are
+    not meant to be passed.
+
     Args:
         pokemon_base (Dict[str, int]): Pokemon stats from the main series game.
             This information is available from the ``pokedex.json`` file.
@@ -73,41 +315,218 @@ def calculate_pogo_stats(
             applied to pokemon with CP over cp_ceiling. Defaults to 0.91.
 
     Returns:
-        Sequence[int]: Tuple of 4 integers: base attack, base defense, base HP,
+        PogoStats: Named tuple of 4 integers: base attack, base defense, base HP,
             and maximum CP in Pokemon Go for the stats.
     """
-    attacks = [pokemon_base["Attack"], pokemon_base["Sp. Attack"]]
-    defenses = [pokemon_base["Defense"], pokemon_base["Sp. Defense"]]
+    return _stats(
+        *_core(
+            pokemon_base["HP"],
+            pokemon_base["Attack"],
+            pokemon_base["Sp. Attack"],
+            pokemon_base["Defense"],
+            pokemon_base["Sp. Defense"],
+            pokemon_base["Speed"],
+            max_iv,
+            cp_modifier * cp_modifier / 10,
+            cp_ceiling,
+            cp_nerf,
+        )
+    )
 
-    pogo_speed = 1 + ((pokemon_base["Speed"] - 75) / 500)
+
+BASE_STATS = ("HP", "Attack", "Defense", "Sp. Attack", "Sp. Defense", "Speed")
+
+
+def _require_numpy(name: str):
+    """Import numpy for the batch helpers, which are the only users of it.
+
+    Args:
+        name (str): Name of the calling function, used in the error message.
+
+    Raises:
+        ImportError: If numpy is not installed.
+
+    Returns:
+        The ``numpy`` module.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(f"numpy is required for {name}") from e
+
+    return numpy
+
+
+def build_base_soa(pokemon_dict: dict) -> Dict[str, "np.ndarray"]:
+    """Stack the base stats of every pokemon into one array per stat.
+
+    Args:
+        pokemon_dict (dict): pokemon dict from :py:func:`choose_pokemon.load_pokemon_file`.
+
+    Returns:
+        Dict[str, np.ndarray]: Base stats keyed by stat name (as in ``pokedex.json``),
+            in the iteration order of ``pokemon_dict``. The pokemon indices are
+            stored under ``"id"``, so the dict does not need contiguous keys.
+    """
+    np = _require_numpy("build_base_soa")
+
+    pokemon_bases = [pokemon["base"] for pokemon in pokemon_dict.values()]
+    base_soa = {
+        stat: np.array([base[stat] for base in pokemon_bases], dtype=np.int16)
+        for stat in BASE_STATS
+    }
+    base_soa["id"] = np.array(list(pokemon_dict), dtype=np.int64)
+    return base_soa
+
+
+def calculate_pogo_stats_batch(
+    base_soa: Dict[str, "np.ndarray"],
+    max_iv: int = 15,
+    cp_modifier: float = 0.7903001,
+    cp_ceiling: int = 4000,
+    cp_nerf: float = 0.91,
+) -> "np.ndarray":
+    """Calculate Pokemon Go stats for many pokemon at once.
+
+    This is the vectorized counterpart of :py:func:`choose_pokemon.calculate_pogo_stats`
+    and gives the same results.
+
+    Args:
+        base_soa (Dict[str, np.ndarray]): Base stats from
+            :py:func:`choose_pokemon.build_base_soa`.
+        max_iv (int, optional): Max individual IV in Pokemon go. Defaults to 15.
+        cp_modifier (float, optional): CP modifier for Pokemon Go.
+            Defaults to 0.7903001.
+        cp_ceiling (int, optional): Ceiling of CP in Pokemon Go. Defaults to 4000.
+        cp_nerf (float, optional): Nerfing factor of CP in Pokemon Go. This is only
+            applied to pokemon with CP over cp_ceiling. Defaults to 0.91.
+
+    Returns:
+        np.ndarray: Integer array of shape ``(N, 4)`` whose columns are base attack,
+            base defense, base HP, and maximum CP in Pokemon Go.
+    """
+    np = _require_numpy("calculate_pogo_stats_batch")
+    max_attack = np.maximum(base_soa["Attack"], base_soa["Sp. Attack"])
+    min_attack = np.minimum(base_soa["Attack"], base_soa["Sp. Attack"])
+    max_defense = np.maximum(base_soa["Defense"], base_soa["Sp. Defense"])
+    min_defense = np.minimum(base_soa["Defense"], base_soa["Sp. Defense"])
+
+    pogo_speed = 1 + ((base_soa["Speed"] - 75) / 500)
     pogo_attack = (
-        round(round(2 * (7 * max(attacks) / 8 + 1 * min(attacks) / 8)) * pogo_speed)
+        np.round(np.round(2 * (7 * max_attack / 8 + 1 * min_attack / 8)) * pogo_speed)
         + max_iv
     )
     pogo_defense = (
-        round(round(2 * (5 * max(defenses) / 8 + 3 * min(defenses) / 8)) * pogo_speed)
+        np.round(np.round(2 * (5 * max_defense / 8 + 3 * min_defense / 8)) * pogo_speed)
         + max_iv
     )
-    pogo_hp = floor(pokemon_base["HP"] * 1.75 + 50) + max_iv
-    pogo_cp = floor(
-        max(
-            [
-                10,
-                (
-                    pogo_attack
-                    * sqrt(pogo_defense)
-                    * sqrt(pogo_hp)
-                    * cp_modifier ** 2
-                    / 10
-                ),
-            ]
-        )
+    pogo_hp = np.floor(base_soa["HP"] * 1.75 + 50) + max_iv
+    # Same operation order as _pogo_stats_core, so the floats round identically.
+    cp_scale = cp_modifier * cp_modifier / 10
+    pogo_cp = np.floor(
+        np.maximum(10, pogo_attack * np.sqrt(pogo_defense * pogo_hp) * cp_scale)
     )
+    pogo_cp = np.where(pogo_cp >= cp_ceiling, np.round(pogo_cp * cp_nerf), pogo_cp)
+
+    return np.stack(
+        [pogo_attack - max_iv, pogo_defense - max_iv, pogo_hp - max_iv, pogo_cp],
+        axis=1,
+    ).astype(np.int64)
+
+
+def build_cp_index(pokemon_dict: dict) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Sort all pokemon by their maximum CP in Pokemon Go.
+
+    Args:
+        pokemon_dict (dict): pokemon dict from :py:func:`choose_pokemon.load_pokemon_file`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Maximum CPs in ascending order, and the
+            pokemon indices in the same order.
+    """
+    np = _require_numpy("build_cp_index")
+    base_soa = build_base_soa(pokemon_dict)
+    pogo_cp = calculate_pogo_stats_batch(base_soa)[:, 3]
+    order = np.argsort(pogo_cp, kind="stable")
+    return pogo_cp[order], base_soa["id"][order]
+
+
+def choose_pokemon_min_cp(
+    cp_index: Tuple["np.ndarray", "np.ndarray"], min_cp: int
+) -> int:
+    """Randomly choose a pokemon whose maximum CP is at least ``min_cp``.
+
+    Args:
+        cp_index (Tuple[np.ndarray, np.ndarray]): CP index from
+            :py:func:`choose_pokemon.build_cp_index`.
+        min_cp (int): Minimum CP of the chosen pokemon.
 
-    if pogo_cp >= cp_ceiling:
-        pogo_cp = round(pogo_cp * cp_nerf)
+    Raises:
+        ValueError: If no pokemon reaches ``min_cp``.
 
-    return pogo_attack - max_iv, pogo_defense - max_iv, pogo_hp - max_iv, pogo_cp
+    Returns:
+        int: Index of the randomly chosen pokemon.
+    """
+    np = _require_numpy("choose_pokemon_min_cp")
+    cp_sorted, ids_sorted_by_cp = cp_index
+    start = int(np.searchsorted(cp_sorted, min_cp, side="left"))
+    if start == len(ids_sorted_by_cp):
+        raise ValueError(f"No pokemon has a maximum CP of at least {min_cp}")
+
+    return int(ids_sorted_by_cp[random.randrange(start, len(ids_sorted_by_cp))])
+
+
+def build_effectiveness_index(
+    type_effectiveness: dict,
+) -> Dict[str, Sequence[Tuple[str, int]]]:
+    """Invert the type effectiveness table so it is keyed by the defending type.
+
+    Args:
+        type_effectiveness (dict): dict containing the type effectiveness of all
+            pokemons, as loaded by :py:func:`choose_pokemon.load_pokemon_effectiveness`.
+
+    Returns:
+        Dict[str, Sequence[Tuple[str, int]]]: For each defending type, a list of
+            ``(attacking type, delta)`` pairs, where delta is +1 for super effective,
+            -1 for not very effective and -2 for no effect.
+    """
+    effectiveness_index = defaultdict(list)
+
+    for category, delta in EFFECTIVENESS_DELTAS:
+        for attacker, defenders in type_effectiveness[category].items():
+            for defender in defenders:
+                effectiveness_index[defender].append((attacker, delta))
+
+    return dict(effectiveness_index)
+
+
+@lru_cache(maxsize=1)
+def load_effectiveness_index() -> Dict[str, Sequence[Tuple[str, int]]]:
+    """Load the type effectiveness index built from ``effectiveness.json``.
+
+    The index is read from the pregenerated ``effectiveness_index`` module (see
+    ``gen_effectiveness.py``) and only rebuilt from the json file when that
+    module is not available.
+
+    Returns:
+        Dict[str, Sequence[Tuple[str, int]]]: Type effectiveness index, see
+            :py:func:`choose_pokemon.build_effectiveness_index`.
+    """
+    try:
+        from effectiveness_index import EFFECTIVENESS_INDEX
+    except ImportError:
+        return build_effectiveness_index(load_pokemon_effectiveness())
+
+    return EFFECTIVENESS_INDEX
+
+
+def _as_effectiveness_index(
+    type_effectiveness: dict,
+) -> Dict[str, Sequence[Tuple[str, int]]]:
+    """Return the effectiveness index for a raw table or an index."""
+    if not any(category in type_effectiveness for category, _ in EFFECTIVENESS_DELTAS):
+        return type_effectiveness
+    return build_effectiveness_index(type_effectiveness)
 
 
 def calculate_pogo_typing(types: List[str], type_effectiveness: dict) -> Dict[str, int]:
@@ -115,55 +534,51 @@ def calculate_pogo_typing(types: List[str], type_effectiveness: dict) -> Dict[st
 
     Args:
         types (List[str]): Types of the pokemon
-        type_effectiveness (dict): dict containing the type effectiveness of all
-            pokemons.
+        type_effectiveness (dict): either a type effectiveness table, as returned
+            by :py:func:`choose_pokemon.load_pokemon_effectiveness`, which is
+            inverted on every call, or the precomputed index from
+            :py:func:`choose_pokemon.load_effectiveness_index`, which is faster.
 
     Returns:
         Dict[str, int]: A dict for the type effectiveness. Positive value indicates
             super effective; negative values indicates not very effective.
     """
-    effective_dict = defaultdict(int)
+    effectiveness_index = _as_effectiveness_index(type_effectiveness)
+    effective_dict = {}
 
     for pogo_type in types:
-        for k, v in type_effectiveness["super effective"].items():
-            if pogo_type in v:
-                effective_dict[k] += 1
-
-        for k, v in type_effectiveness["not very effective"].items():
-            if pogo_type in v:
-                effective_dict[k] -= 1
+        for attacker, delta in effectiveness_index.get(pogo_type, ()):
+            effective_dict[attacker] = effective_dict.get(attacker, 0) + delta
 
-        for k, v in type_effectiveness["no effect"].items():
-            if pogo_type in v:
-                effective_dict[k] -= 2
-
-    return sorted(effective_dict.items(), key=lambda item: item[1], reverse=True)
+    return sorted(effective_dict.items(), key=itemgetter(1), reverse=True)
 
 
 def choose_pokemon(
     pokemon_dict: dict, type_effectiveness: dict
-) -> Tuple[int, dict, dict]:
+) -> Tuple[int, dict, PogoStats, list]:
     """Randomly choose a pokemon and return its attributes.
 
     The attributes we return include:
     * pokemon_idx: int index of the randomly chosen pokemon.
     * pokemon: a dict of pokemon attributes which include name, base stats, and type.
-    * pokemon_stats: a dict of pokemon stats.
+    * pokemon_stats: a :py:class:`choose_pokemon.PogoStats` of pokemon stats.
 
     Args:
         pokemon_dict (dict): pokemon dict from :py:func:`choose_pokemon.load_pokemon_file`.
+        type_effectiveness (dict): type effectiveness table or index, see
+            :py:func:`choose_pokemon.calculate_pogo_typing`.
 
     Returns:
-        Tuple[int, dict, dict]: tuple of pokemon attributes. The attributes we return include:
+        Tuple[int, dict, PogoStats, list]: tuple of pokemon attributes. The
+        attributes we return include:
 
         * pokemon_idx: int index of the randomly chosen pokemon.
         * pokemon: a dict of pokemon attributes which include name, base stats, and type.
-        * pokemon_stats: a dict of pokemon stats.
+        * pokemon_stats: a :py:class:`choose_pokemon.PogoStats` of pokemon stats.
     """
-    pokemon_idx = random.choice(list(pokemon_dict.keys()))
+    pokemon_idx = random.choice(tuple(pokemon_dict))
     pokemon = pokemon_dict[pokemon_idx]
-    pokemon_stats_list = calculate_pogo_stats(pokemon_base=pokemon["base"])
-    pokemon_stats = dict(zip(["ATK", "DEF", "STA", "CP"], pokemon_stats_list))
+    pokemon_stats = calculate_pogo_stats(pokemon_base=pokemon["base"])
     pokemon_effectiveness = calculate_pogo_typing(
         types=pokemon["type"], type_effectiveness=type_effectiveness
     )
@@ -171,17 +586,26 @@ def choose_pokemon(
 
 
 if __name__ == "__main__":
-    pokemons = load_pokemon_file()
-    effectiveness = load_pokemon_effectiveness()
+    split_pokemon_ids = load_split_pokemon_ids()
+    if split_pokemon_ids:
+        # Only the chosen pokemon is parsed when split_pokedex.py has been run.
+        pokemon_idx = random.choice(split_pokemon_ids)
+        pokemons = {pokemon_idx: load_pokemon_by_id(pokemon_idx)}
+    else:
+        pokemons = load_pokemon_file()
+    effectiveness_index = load_effectiveness_index()
     pokemon_idx, pokemon, pokemon_stats, pokemon_effectiveness = choose_pokemon(
-        pokemon_dict=pokemons, type_effectiveness=effectiveness
+        pokemon_dict=pokemons, type_effectiveness=effectiveness_index
     )
     print(
         f"index: {pokemon_idx}\n"
         f'name: {pokemon["name"]}\n'
-        f"stats: {pokemon_stats}\n"
+        f"stats: {pokemon_stats._asdict()}\n"
         f'type: {pokemon["type"]}\n'
         f"type effectiveness: {pokemon_effectiveness}"
     )
-    image = Image.open(os.path.join("images", f"{str(pokemon_idx).zfill(3)}.png"))
-    image.show()
+    if "--no-image" not in sys.argv[1:] and not os.environ.get("POKEMON_NO_IMAGE"):
+        from PIL import Image
+
+        image = Image.open(os.path.join("images", f"{pokemon_idx:03d}.png"))
+        image.show()
@@ -0,0 +1,163 @@
+"""Type effectiveness index, keyed by the defending type.
+
+Generated by ``gen_effectiveness.py`` from ``effectiveness.json``; do not edit.
+"""
+
+EFFECTIVENESS_INDEX = {
+    "Grass": (
+        ("Fire", 1),
+        ("Ice", 1),
+        ("Poison", 1),
+        ("Flying", 1),
+        ("Bug", 1),
+        ("Water", -1),
+        ("Electric", -1),
+        ("Grass", -1),
+        ("Ground", -1),
+    ),
+    "Ice": (
+        ("Fire", 1),
+        ("Fighting", 1),
+        ("Rock", 1),
+        ("Steel", 1),
+        ("Ice", -1),
+    ),
+    "Bug": (
+        ("Fire", 1),
+        ("Flying", 1),
+        ("Rock", 1),
+        ("Grass", -1),
+        ("Fighting", -1),
+        ("Ground", -1),
+    ),
+    "Steel": (
+        ("Fire", 1),
+        ("Fighting", 1),
+        ("Ground", 1),
+        ("Normal", -1),
+        ("Grass", -1),
+        ("Ice", -1),
+        ("Flying", -1),
+        ("Psychic", -1),
+        ("Bug", -1),
+        ("Rock", -1),
+        ("Dragon", -1),
+        ("Steel", -1),
+        ("Fairy", -1),
+        ("Poison", -2),
+    ),
+    "Fire": (
+        ("Water", 1),
+        ("Ground", 1),
+        ("Rock", 1),
+        ("Fire", -1),
+        ("Grass", -1),
+        ("Ice", -1),
+        ("Bug", -1),
+        ("Steel", -1),
+        ("Fairy", -1),
+    ),
+    "Ground": (
+        ("Water", 1),
+        ("Grass", 1),
+        ("Ice", 1),
+        ("Poison", -1),
+        ("Rock", -1),
+        ("Electric", -2),
+    ),
+    "Rock": (
+        ("Water", 1),
+        ("Grass", 1),
+        ("Fighting", 1),
+        ("Ground", 1),
+        ("Steel", 1),
+        ("Normal", -1),
+        ("Fire", -1),
+        ("Poison", -1),
+        ("Flying", -1),
+    ),
+    "Water": (
+        ("Electric", 1),
+        ("Grass", 1),
+        ("Fire", -1),
+        ("Water", -1),
+        ("Ice", -1),
+        ("Steel", -1),
+    ),
+    "Flying": (
+        ("Electric", 1),
+        ("Ice", 1),
+        ("Rock", 1),
+        ("Grass", -1),
+        ("Fighting", -1),
+        ("Bug", -1),
+        ("Ground", -2),
+    ),
+    "Dragon": (
+        ("Ice", 1),
+        ("Dragon", 1),
+        ("Fairy", 1),
+        ("Fire", -1),
+        ("Water", -1),
+        ("Electric", -1),
+        ("Grass", -1),
+    ),
+    "Normal": (
+        ("Fighting", 1),
+        ("Ghost", -2),
+    ),
+    "Dark": (
+        ("Fighting", 1),
+        ("Bug", 1),
+        ("Fairy", 1),
+        ("Ghost", -1),
+        ("Dark", -1),
+        ("Psychic", -2),
+    ),
+    "Fairy": (
+        ("Poison", 1),
+        ("Steel", 1),
+        ("Fighting", -1),
+        ("Bug", -1),
+        ("Dark", -1),
+        ("Dragon", -2),
+    ),
+    "Electric": (
+        ("Ground", 1),
+        ("Electric", -1),
+        ("Flying", -1),
+        ("Steel", -1),
+    ),
+    "Poison": (
+        ("Ground", 1),
+        ("Psychic", 1),
+        ("Grass", -1),
+        ("Fighting", -1),
+        ("Poison", -1),
+        ("Bug", -1),
+        ("Fairy", -1),
+    ),
+    "Fighting": (
+        ("Flying", 1),
+        ("Psychic", 1),
+        ("Fairy", 1),
+        ("Bug", -1),
+        ("Rock", -1),
+        ("Dark", -1),
+    ),
+    "Psychic": (
+        ("Bug", 1),
+        ("Ghost", 1),
+        ("Dark", 1),
+        ("Fighting", -1),
+        ("Psychic", -1),
+    ),
+    "Ghost": (
+        ("Ghost", 1),
+        ("Dark", 1),
+        ("Poison", -1),
+        ("Bug", -1),
+        ("Normal", -2),
+        ("Fighting", -2),
+    ),
+}
@@ -0,0 +1,50 @@
+"""Generate ``effectiveness_index.py`` from ``effectiveness.json``.
+
+The generated module holds the type effectiveness index as a literal, so
+:py:func:`choose_pokemon.load_effectiveness_index` can import it instead of
+parsing the json file. Rerun this script whenever ``effectiveness.json`` changes.
+
+To run::
+    python gen_effectiveness.py
+"""
+import json
+import os
+
+from choose_pokemon import build_effectiveness_index, load_pokemon_effectiveness
+
+HEADER = '''"""Type effectiveness index, keyed by the defending type.
+
+Generated by ``gen_effectiveness.py`` from ``effectiveness.json``; do not edit.
+"""
+'''
+
+
+def gen_effectiveness() -> str:
+    """Write the type effectiveness index to ``effectiveness_index.py``.
+
+    Returns:
+        str: Path of the written file.
+    """
+    effectiveness_index = build_effectiveness_index(load_pokemon_effectiveness())
+
+    lines = [HEADER, "EFFECTIVENESS_INDEX = {"]
+    for defender, attackers in effectiveness_index.items():
+        lines.append(f"    {json.dumps(defender)}: (")
+        lines.extend(
+            f"        ({json.dumps(attacker)}, {delta}),"
+            for attacker, delta in attackers
+        )
+        lines.append("    ),")
+    lines.append("}")
+
+    fpath = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "effectiveness_index.py"
+    )
+    with open(fpath, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    return fpath
+
+
+if __name__ == "__main__":
+    print(f"wrote {gen_effectiveness()}")
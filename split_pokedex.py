@@ -0,0 +1,47 @@
+"""Split ``pokedex.json`` into one file per pokemon.
+
+Each entry of ``pokedex.json`` is written unchanged to ``pokedex/<index>.json``
+(e.g. ``pokedex/025.json``), which lets
+:py:func:`choose_pokemon.load_pokemon_by_id` read a single pokemon without parsing
+the whole pokedex. The indices are listed in ``pokedex/ids.json``, which is
+written last; ``choose_pokemon.py`` picks from it when it is newer than
+``pokedex.json``.
+
+To run::
+    python split_pokedex.py
+"""
+import json
+import os
+from typing import Optional
+
+
+def split_pokedex(out_folder: Optional[str] = None) -> int:
+    """Write every pokemon in ``pokedex.json`` to its own file.
+
+    Args:
+        out_folder (Optional[str], optional): Folder to write the files to.
+            Defaults to the ``pokedex`` folder next to this file.
+
+    Returns:
+        int: Number of files written.
+    """
+    folder = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(folder, "pokedex.json"), encoding="utf-8") as f:
+        pokemon_json = json.load(f)
+
+    if out_folder is None:
+        out_folder = os.path.join(folder, "pokedex")
+    os.makedirs(out_folder, exist_ok=True)
+    for pokemon in pokemon_json:
+        fpath = os.path.join(out_folder, f"{pokemon['id']:03d}.json")
+        with open(fpath, "w", encoding="utf-8") as f:
+            json.dump(pokemon, f, ensure_ascii=False, indent=2)
+
+    with open(os.path.join(out_folder, "ids.json"), "w", encoding="utf-8") as f:
+        json.dump([pokemon["id"] for pokemon in pokemon_json], f)
+
+    return len(pokemon_json)
+
+
+if __name__ == "__main__":
+    print(f"wrote {split_pokedex()} files")
@@ -1,12 +1,38 @@
+import os
+import pickle
+import random
+import shutil
+import sys
+from math import floor, sqrt
+
+import choose_pokemon as choose_pokemon_module
 import pytest
-from choose_pokemon import get_max_pogo_cp
+from choose_pokemon import (
+    BASE_STATS,
+    _jit_pogo_stats_core,
+    _read_pokedex,
+    build_base_soa,
+    build_cp_index,
+    build_effectiveness_index,
+    calculate_pogo_stats,
+    calculate_pogo_stats_batch,
+    calculate_pogo_typing,
+    choose_pokemon,
+    choose_pokemon_min_cp,
+    load_effectiveness_index,
+    load_pokemon_by_id,
+    load_pokemon_effectiveness,
+    load_pokemon_file,
+    load_split_pokemon_ids,
+)
+from split_pokedex import split_pokedex
 
 
 iv_tol = 1
 cp_tol = 10
 
 
-def test_get_max_pogo_cp_pikachu():
+def test_calculate_pogo_stats_shinx():
     shinx_base = {
         "HP": 35,
         "Attack": 55,
@@ -15,7 +41,7 @@ def test_get_max_pogo_cp_pikachu():
         "Sp. Defense": 50,
         "Speed": 90,
     }
-    pogo_attack, pogo_defense, pogo_hp, pogo_cp = get_max_pogo_cp(
+    pogo_attack, pogo_defense, pogo_hp, pogo_cp = calculate_pogo_stats(
         pokemon_base=shinx_base
     )
 
@@ -23,3 +49,274 @@ def test_get_max_pogo_cp_pikachu():
     assert abs(pogo_defense - 96) <= iv_tol
     assert abs(pogo_hp - 111) <= iv_tol
     assert abs(pogo_cp - 938) <= cp_tol
+
+
+def _random_bases(n, seed=1):
+    rng = random.Random(seed)
+    stats = ("HP", "Attack", "Defense", "Sp. Attack", "Sp. Defense", "Speed")
+    return [{stat: rng.randint(1, 255) for stat in stats} for _ in range(n)]
+
+
+def test_calculate_pogo_stats_batch_matches_scalar():
+    pytest.importorskip("numpy")
+    pokemon_dict = load_pokemon_file()
+    batch_stats = calculate_pogo_stats_batch(build_base_soa(pokemon_dict))
+
+    assert batch_stats.shape == (len(pokemon_dict), 4)
+    for pokemon_idx, pokemon in pokemon_dict.items():
+        expected = tuple(calculate_pogo_stats(pokemon_base=pokemon["base"]))
+        assert tuple(batch_stats[pokemon_idx - 1]) == expected
+
+
+@pytest.mark.parametrize("cp_modifier", [0.7903001, 0.5, 0.6297532])
+def test_calculate_pogo_stats_batch_matches_scalar_on_random_stats(cp_modifier):
+    pytest.importorskip("numpy")
+    bases = _random_bases(20000)
+    pokemon_dict = {idx: {"base": base} for idx, base in enumerate(bases, 1)}
+    batch_stats = calculate_pogo_stats_batch(
+        build_base_soa(pokemon_dict), cp_modifier=cp_modifier
+    )
+
+    for row, base in zip(batch_stats, bases):
+        assert tuple(row) == tuple(
+            calculate_pogo_stats(pokemon_base=base, cp_modifier=cp_modifier)
+        )
+
+
+def test_calculate_pogo_stats_batch_requires_numpy(monkeypatch):
+    base_soa = {stat: [50] for stat in BASE_STATS}
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    with pytest.raises(ImportError, match="numpy is required"):
+        calculate_pogo_stats_batch(base_soa)
+
+
+def _reference_pogo_stats(pokemon_base, max_iv=15, cp_modifier=0.7903001):
+    attacks = [pokemon_base["Attack"], pokemon_base["Sp. Attack"]]
+    defenses = [pokemon_base["Defense"], pokemon_base["Sp. Defense"]]
+
+    pogo_speed = 1 + ((pokemon_base["Speed"] - 75) / 500)
+    pogo_attack = (
+        round(round(2 * (7 * max(attacks) / 8 + 1 * min(attacks) / 8)) * pogo_speed)
+        + max_iv
+    )
+    pogo_defense = (
+        round(round(2 * (5 * max(defenses) / 8 + 3 * min(defenses) / 8)) * pogo_speed)
+        + max_iv
+    )
+    pogo_hp = floor(pokemon_base["HP"] * 1.75 + 50) + max_iv
+    pogo_cp = floor(
+        max(
+            10,
+            pogo_attack * sqrt(pogo_defense) * sqrt(pogo_hp) * cp_modifier ** 2 / 10,
+        )
+    )
+    if pogo_cp >= 4000:
+        pogo_cp = round(pogo_cp * 0.91)
+
+    return pogo_attack - max_iv, pogo_defense - max_iv, pogo_hp - max_iv, pogo_cp
+
+
+def test_calculate_pogo_stats_matches_reference_formula():
+    for pokemon in load_pokemon_file().values():
+        assert tuple(calculate_pogo_stats(pokemon_base=pokemon["base"])) == (
+            _reference_pogo_stats(pokemon["base"])
+        )
+
+
+def test_calculate_pogo_stats_matches_reference_on_random_stats():
+    for base in _random_bases(20000):
+        assert tuple(calculate_pogo_stats(pokemon_base=base)) == (
+            _reference_pogo_stats(base)
+        )
+
+
+def test_jit_pogo_stats_core_matches_reference_on_random_stats():
+    pytest.importorskip("numba")
+    jit_core = _jit_pogo_stats_core()
+
+    for base in _random_bases(20000):
+        assert tuple(calculate_pogo_stats(pokemon_base=base, _core=jit_core)) == (
+            _reference_pogo_stats(base)
+        )
+
+
+def test_load_pokemon_by_id_reads_split_files(tmp_path, monkeypatch):
+    pokemon_dict = load_pokemon_file()
+    assert split_pokedex(str(tmp_path)) == len(pokemon_dict)
+
+    # Fail loudly if the loader falls back to the full pokedex.
+    monkeypatch.setattr(choose_pokemon_module, "load_pokemon_file", None)
+    for pokemon_idx in (1, 25, len(pokemon_dict)):
+        assert (
+            load_pokemon_by_id(pokemon_idx, pokedex_folder=str(tmp_path))
+            == pokemon_dict[pokemon_idx]
+        )
+
+
+def test_load_pokemon_by_id_falls_back_to_pokedex(tmp_path):
+    assert load_pokemon_by_id(25, pokedex_folder=str(tmp_path)) == (
+        load_pokemon_file()[25]
+    )
+
+
+def test_load_pokemon_by_id_ignores_stale_files(tmp_path, monkeypatch):
+    split_pokedex(str(tmp_path))
+    stale_path = tmp_path / "025.json"
+    stale_mtime = os.path.getmtime(choose_pokemon_module._pokedex_json_path()) - 10
+    os.utime(stale_path, (stale_mtime, stale_mtime))
+
+    monkeypatch.setattr(
+        choose_pokemon_module, "load_pokemon_file", lambda: {25: "from pokedex"}
+    )
+    assert load_pokemon_by_id(25, pokedex_folder=str(tmp_path)) == "from pokedex"
+    assert load_pokemon_by_id(26, pokedex_folder=str(tmp_path)) != "from pokedex"
+
+
+def test_load_split_pokemon_ids(tmp_path):
+    assert load_split_pokemon_ids(str(tmp_path)) is None
+
+    split_pokedex(str(tmp_path))
+    assert load_split_pokemon_ids(str(tmp_path)) == list(load_pokemon_file())
+
+    stale_mtime = os.path.getmtime(choose_pokemon_module._pokedex_json_path()) - 10
+    os.utime(tmp_path / "ids.json", (stale_mtime, stale_mtime))
+    assert load_split_pokemon_ids(str(tmp_path)) is None
+
+
+def test_effectiveness_index_module_is_up_to_date():
+    from effectiveness_index import EFFECTIVENESS_INDEX
+
+    expected = build_effectiveness_index(load_pokemon_effectiveness())
+    assert {k: list(v) for k, v in EFFECTIVENESS_INDEX.items()} == {
+        k: list(v) for k, v in expected.items()
+    }
+
+
+def test_choose_pokemon_min_cp():
+    pytest.importorskip("numpy")
+    pokemon_dict = load_pokemon_file()
+    cp_index = build_cp_index(pokemon_dict)
+
+    for _ in range(50):
+        pokemon_idx = choose_pokemon_min_cp(cp_index, min_cp=2500)
+        assert calculate_pogo_stats(pokemon_dict[pokemon_idx]["base"]).CP >= 2500
+
+    with pytest.raises(ValueError):
+        choose_pokemon_min_cp(cp_index, min_cp=int(cp_index[0][-1]) + 1)
+
+
+def test_calculate_pogo_typing_accepts_table_and_index():
+    type_effectiveness = load_pokemon_effectiveness()
+    expected = calculate_pogo_typing(["Grass", "Poison"], load_effectiveness_index())
+
+    assert expected
+    assert calculate_pogo_typing(["Grass", "Poison"], type_effectiveness) == expected
+    assert (
+        calculate_pogo_typing(["Grass", "Poison"], dict(type_effectiveness))
+        == expected
+    )
+
+
+def test_calculate_pogo_typing_custom_table_needs_no_files(monkeypatch):
+    def fail():
+        raise AssertionError("effectiveness.json must not be read")
+
+    monkeypatch.setattr(choose_pokemon_module, "load_pokemon_effectiveness", fail)
+    monkeypatch.setattr(choose_pokemon_module, "load_effectiveness_index", fail)
+    type_effectiveness = {
+        "super effective": {"Water": ["Fire"]},
+        "not very effective": {"Grass": ["Fire"], "Fire": ["Fire"]},
+        "no effect": {},
+    }
+
+    assert calculate_pogo_typing(["Fire"], type_effectiveness) == [
+        ("Water", 1),
+        ("Grass", -1),
+        ("Fire", -1),
+    ]
+
+
+def test_read_pokedex_pickle_sidecar(tmp_path):
+    fpath = str(tmp_path / "pokedex.json")
+    pkl_path = str(tmp_path / "pokedex.pkl")
+    shutil.copy(os.path.join(os.path.dirname(__file__), "pokedex.json"), fpath)
+    expected = load_pokemon_file()
+
+    # The first read parses the json and writes the sidecar.
+    assert _read_pokedex(fpath) == expected
+    with open(pkl_path, "rb") as f:
+        assert pickle.load(f) == expected
+
+    # An up-to-date sidecar is read instead of the json.
+    with open(pkl_path, "wb") as f:
+        pickle.dump({"cached": True}, f)
+    assert _read_pokedex(fpath) == {"cached": True}
+
+    # A sidecar older than the json is ignored and rewritten.
+    json_mtime = os.path.getmtime(fpath)
+    os.utime(pkl_path, (json_mtime - 10, json_mtime - 10))
+    assert _read_pokedex(fpath) == expected
+
+    # A truncated sidecar is treated as a cache miss.
+    with open(pkl_path, "rb") as f:
+        data = f.read()
+    with open(pkl_path, "wb") as f:
+        f.write(data[: len(data) // 2])
+    assert _read_pokedex(fpath) == expected
+    assert _read_pokedex(fpath) == expected
+    assert sorted(os.listdir(tmp_path)) == ["pokedex.json", "pokedex.pkl"]
+
+
+@pytest.mark.parametrize(
+    "garbage",
+    [b"", b"not a pickle", pickle.dumps([1, 2, 3]), b"\x80\x7f" + b"\x00" * 8],
+)
+def test_read_pokedex_ignores_garbage_sidecar(tmp_path, garbage):
+    fpath = str(tmp_path / "pokedex.json")
+    shutil.copy(os.path.join(os.path.dirname(__file__), "pokedex.json"), fpath)
+    with open(tmp_path / "pokedex.pkl", "wb") as f:
+        f.write(garbage)
+
+    assert _read_pokedex(fpath) == load_pokemon_file()
+
+
+def test_read_pokedex_ignores_unreadable_sidecar(tmp_path):
+    fpath = str(tmp_path / "pokedex.json")
+    shutil.copy(os.path.join(os.path.dirname(__file__), "pokedex.json"), fpath)
+    # A directory cannot be opened for reading, even by root.
+    (tmp_path / "pokedex.pkl").mkdir()
+
+    assert _read_pokedex(fpath) == load_pokemon_file()
+
+
+def test_read_pokedex_sidecar_honors_umask(tmp_path):
+    fpath = str(tmp_path / "pokedex.json")
+    shutil.copy(os.path.join(os.path.dirname(__file__), "pokedex.json"), fpath)
+    umask = os.umask(0o022)
+    try:
+        _read_pokedex(fpath)
+    finally:
+        os.umask(umask)
+
+    assert os.stat(tmp_path / "pokedex.pkl").st_mode & 0o777 == 0o644
+
+
+def test_sparse_pokemon_dict():
+    pytest.importorskip("numpy")
+    sparse_dict = {
+        pokemon_idx: pokemon
+        for pokemon_idx, pokemon in load_pokemon_file().items()
+        if pokemon_idx % 7 == 0
+    }
+
+    for _ in range(20):
+        pokemon_idx, pokemon, _, _ = choose_pokemon(
+            sparse_dict, load_effectiveness_index()
+        )
+        assert pokemon is sparse_dict[pokemon_idx]
+
+    cp_sorted, ids_sorted_by_cp = build_cp_index(sparse_dict)
+    assert sorted(ids_sorted_by_cp) == sorted(sparse_dict)
+    for pogo_cp, pokemon_idx in zip(cp_sorted, ids_sorted_by_cp):
+        assert calculate_pogo_stats(sparse_dict[pokemon_idx]["base"]).CP == pogo_cp